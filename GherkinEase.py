@@ -1,34 +1,33 @@
 import base64
 import streamlit as st
-import pdfplumber
-import fitz
 import pandas as pd
-import textdistance
 import re
 from autocorrect import Speller
 
+import startup_bundle
+
 st.set_page_config(
     layout="wide", 
     page_title="GherkinEase", 
     page_icon="GE_logo.png"
 )
-# Function to load keywords and related details from Excel
+# Function to load keywords and related details (from the startup bundle when present, else from Excel)
 @st.cache_data
 def load_keywords():
-    df = pd.read_excel('Keyword_Identified.xlsx', sheet_name='KEYWORDS', header=None)
-    column_names = df.iloc[6].tolist()  # Extract column names from the 7th row (index 6)
-    df = df.iloc[7:].reset_index(drop=True)  # Remove the first 7 rows
-    df.dropna(subset=[df.columns[1]], inplace=True)  # Drop rows where the keyword is NaN
-    df.columns = column_names  # Set column names from the 7th row
-    keywords_dict = df.set_index(df.columns[1]).T.to_dict('list')  # Map keywords to their details
+    bundled = startup_bundle.load_keywords()
+    if bundled is not None:
+        return bundled
+    df, column_names = startup_bundle.read_keywords_workbook(startup_bundle.KEYWORDS_WORKBOOK)
+    keywords_dict = startup_bundle.keywords_to_dict(df)
     return df, keywords_dict, column_names
  
 # Function to load signals from the corecil Excel
 @st.cache_data
 def load_signals():
-    rx_df = pd.read_excel('CORE_CIL_v27.1_09Feb2024 1.xlsx', sheet_name='Rx')
-    tx_df = pd.read_excel('CORE_CIL_v27.1_09Feb2024 1.xlsx', sheet_name='Tx')
-    return rx_df, tx_df
+    bundled = startup_bundle.load_signals()
+    if bundled is not None:
+        return bundled
+    return startup_bundle.read_signals_workbook(startup_bundle.SIGNALS_WORKBOOK)
  
 # Function to display PDF files
 def display_pdf(file_path):
@@ -285,8 +284,15 @@ def main():
     elif st.session_state.selected_menu == "🔍 Keyword Guidelines":
         display_keyword_guidelines()
 
-# Create a spell checker object
-spell = Speller(lang='en')
+# Create the spell checker once per process instead of on every rerun
+@st.cache_resource
+def load_speller():
+    nlp_data = startup_bundle.load_spell_data()
+    if nlp_data is not None:
+        return Speller(lang='en', nlp_data=nlp_data)
+    return Speller(lang='en')
+
+spell = load_speller()
  
 # Function to display corrected input
 def autocorrect_input(input_text):
@@ -0,0 +1,356 @@
+import argparse
+import hashlib
+import os
+import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import freeze_support
+
+import numpy as np
+import textdistance
+
+import startup_bundle
+
+# "Example:" is a synonym of "Scenario:"; the "Examples:" table header is matched by SECTION_RE
+SCENARIO_RE = re.compile(r'^\s*(?:Scenario(?: Outline| Template)?|Example):\s*(.*)$')
+STEP_RE = re.compile(r'^\s*(Given|When|Then|And|But|\*)\s+(.*)$')
+# Blocks that end the steps of the current scenario
+SECTION_RE = re.compile(r'^\s*(Feature|Background|Rule|Examples|Scenarios):')
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+NUM_PERM = 128
+BANDS = 32
+SHINGLE_SIZE = 3
+# Buckets larger than this are verified against their first member only, to keep the search sub-quadratic
+MAX_BUCKET_SIZE = 64
+
+
+# Function to split Gherkin text into scenarios with their Given/When/Then steps
+def parse_scenarios(text, source=''):
+    scenarios = []
+    current = None
+    last_kind = 'Given'
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        scenario_match = SCENARIO_RE.match(line)
+        if scenario_match:
+            current = {'source': source, 'line': line_number, 'name': scenario_match.group(1).strip(), 'steps': []}
+            scenarios.append(current)
+            last_kind = 'Given'
+            continue
+        if SECTION_RE.match(line):
+            current = None
+            continue
+        step_match = STEP_RE.match(line)
+        if current is not None and step_match:
+            kind, statement = step_match.groups()
+            if kind in ('Given', 'When', 'Then'):
+                last_kind = kind
+            # "And" and "But" take the kind of the step they extend
+            current['steps'].append((last_kind, statement.strip()))
+    return [scenario for scenario in scenarios if scenario['steps']]
+
+
+def scenario_label(scenario):
+    location = f"{scenario['source']}:{scenario['line']}" if scenario['source'] else f"line {scenario['line']}"
+    return f"{location} {scenario['name']}"
+
+
+def step_keyword(statement):
+    """Returns the keyword of a step: the statement with its quoted values and <tags> blanked out.
+
+    'the "average state of charge" is "in between" "30 to 80" percentage' and the
+    same step with other values share one keyword, so they count as a reuse.
+    """
+    keyword = re.sub(r'"[^"]*"', '""', statement)
+    keyword = re.sub(r'<[^>]*>', '<>', keyword)
+    return ' '.join(keyword.lower().split())
+
+
+def scenario_tokens(scenario):
+    """Returns the words of a scenario, each step prefixed with its Given/When/Then kind."""
+    tokens = []
+    for kind, statement in scenario['steps']:
+        tokens.append(kind.lower())
+        tokens.extend(re.findall(r'\w+|[<>"]', statement.lower()))
+    return tokens
+
+
+def _hash_shingle(shingle):
+    # hashlib instead of hash() so every process in the pool agrees on the value
+    return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=4).digest(), 'little')
+
+
+@lru_cache(maxsize=None)
+def _permutations(num_perm):
+    generator = np.random.RandomState(1)
+    a = generator.randint(1, MAX_HASH, size=num_perm, dtype=np.uint64)
+    b = generator.randint(0, MAX_HASH, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def shingles(tokens, shingle_size=SHINGLE_SIZE):
+    """Returns the overlapping word n-grams of a token list, in order."""
+    size = min(shingle_size, len(tokens)) or 1
+    return [' '.join(tokens[i:i + size]) for i in range(max(len(tokens) - size + 1, 1))]
+
+
+def minhash_signature(tokens, num_perm=NUM_PERM):
+    """Returns the MinHash signature of the word shingles of a token list."""
+    hashes = np.array([_hash_shingle(shingle) for shingle in set(shingles(tokens))], dtype=np.uint64)
+    a, b = _permutations(num_perm)
+    # a, b and the hashes are below 2**32, so a * hash + b cannot overflow 64 bits
+    permuted = (np.outer(hashes, a) + b) % np.uint64(MERSENNE_PRIME)
+    return (permuted.min(axis=0) & np.uint64(MAX_HASH)).astype(np.uint32)
+
+
+def _signatures(token_lists, num_perm):
+    return [minhash_signature(tokens, num_perm) for tokens in token_lists]
+
+
+def _verify(pairs, token_lists, threshold):
+    """Returns the candidate pairs whose shingles are at least threshold similar.
+
+    MinHash only estimates the Jaccard similarity; textdistance computes it
+    exactly on the shingle lists, so repeated steps are counted too.
+    """
+    matches = []
+    for first, second in pairs:
+        similarity = textdistance.jaccard.normalized_similarity(
+            shingles(token_lists[first]), shingles(token_lists[second])
+        )
+        if similarity >= threshold:
+            matches.append((first, second, similarity))
+    return matches
+
+
+def _verify_chunk(args):
+    return _verify(*args)
+
+
+def _signatures_chunk(args):
+    return _signatures(*args)
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def candidate_pairs(signatures, bands=BANDS):
+    """Returns index pairs that share at least one LSH band of their MinHash signatures."""
+    matrix = np.vstack(signatures)
+    rows = matrix.shape[1] // bands
+    pairs = set()
+    for band in range(bands):
+        # View each band as one opaque value so np.unique groups identical bands
+        keys = np.ascontiguousarray(matrix[:, band * rows:(band + 1) * rows]).view(np.dtype((np.void, rows * 4)))
+        _, bucket_of, counts = np.unique(keys.ravel(), return_inverse=True, return_counts=True)
+        shared = np.flatnonzero(counts[bucket_of] > 1)
+        buckets = defaultdict(list)
+        for index in shared.tolist():
+            buckets[bucket_of[index]].append(index)
+        for members in buckets.values():
+            if len(members) <= MAX_BUCKET_SIZE:
+                pairs.update((first, second) for i, first in enumerate(members) for second in members[i + 1:])
+            else:
+                pairs.update((members[0], other) for other in members[1:])
+    return sorted(pairs)
+
+
+def _cluster(count, matches):
+    parent = list(range(count))
+
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    for first, second, _ in matches:
+        parent[find(second)] = find(first)
+
+    groups = defaultdict(list)
+    for index in range(count):
+        groups[find(index)].append(index)
+    return [members for members in groups.values() if len(members) > 1]
+
+
+def _library_form(keyword):
+    # Catalog entries and steps do not agree on a leading "the"
+    return keyword[4:] if keyword.startswith('the ') else keyword
+
+
+def library_keywords(catalog_keywords):
+    """Returns the normalised keywords of the catalog's keyword column.
+
+    An entry may list alternatives on following lines marked with "--->".
+    """
+    library = set()
+    for entry in catalog_keywords:
+        for alternative in re.split(r'\n\s*-*>?', str(entry)):
+            keyword = step_keyword(alternative)
+            if keyword:
+                library.add(_library_form(keyword))
+    return library
+
+
+# Function to load the keyword library from Keyword_Identified.xlsx
+def load_library(path=None):
+    if path is None:
+        path = os.path.join(startup_bundle.app_dir(), startup_bundle.KEYWORDS_WORKBOOK)
+    df, _ = startup_bundle.read_keywords_workbook(path)
+    return library_keywords(df.iloc[:, 1])
+
+
+def keyword_report(scenarios, library=None):
+    """Returns keyword combinations used by several scenarios, keywords repeated inside one scenario
+    and, when a library is given, step keywords missing from it.
+    """
+    combinations = defaultdict(list)
+    repeated = {}
+    unknown = {}
+    for scenario in scenarios:
+        keywords = [(kind, step_keyword(statement)) for kind, statement in scenario['steps']]
+        combinations[tuple(keywords)].append(scenario_label(scenario))
+        if library is not None:
+            missing = sorted({keyword for _, keyword in keywords if _library_form(keyword) not in library})
+            if missing:
+                unknown[scenario_label(scenario)] = missing
+        seen = defaultdict(int)
+        for _, keyword in keywords:
+            seen[keyword] += 1
+        duplicates = sorted(keyword for keyword, count in seen.items() if count > 1)
+        if duplicates:
+            # The guidelines require that a keyword does not repeat in the scenario
+            repeated[scenario_label(scenario)] = duplicates
+    reused = {combination: labels for combination, labels in combinations.items() if len(labels) > 1}
+    return reused, repeated, unknown
+
+
+def find_duplicate_scenarios(scenarios, threshold=0.8, workers=None, num_perm=NUM_PERM, bands=BANDS, library=None):
+    """Clusters duplicate and near-duplicate scenarios.
+
+    MinHash signatures and LSH banding pick candidate pairs without comparing
+    every scenario to every other; each candidate is then confirmed with
+    textdistance. Signatures and verification run across a process pool when
+    workers is not 1. Verified pairs are chained into clusters, so two
+    members of a cluster may be less similar than the threshold to each
+    other; 'min_link_similarity' is the lowest similarity among the verified
+    pairs that joined it. Returns a dict with 'clusters', 'keyword_reuse',
+    'repeated_keywords' and 'unknown_keywords' (empty unless a library from
+    load_library is given).
+    """
+    if num_perm % bands:
+        raise ValueError("num_perm must be a multiple of bands")
+    token_lists = [scenario_tokens(scenario) for scenario in scenarios]
+    matches = []
+    if len(scenarios) > 1:
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            signatures = _signatures(token_lists, num_perm)
+            matches = _verify(candidate_pairs(signatures, bands), token_lists, threshold)
+        else:
+            chunk_size = max(len(token_lists) // (workers * 4), 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                signatures = [
+                    signature
+                    for chunk in executor.map(_signatures_chunk,
+                                              [(chunk, num_perm) for chunk in _chunks(token_lists, chunk_size)])
+                    for signature in chunk
+                ]
+                pairs = candidate_pairs(signatures, bands)
+                pair_chunk_size = max(len(pairs) // (workers * 4), 1)
+                # Each task gets only the token lists its pairs refer to
+                jobs = []
+                for pair_chunk in _chunks(pairs, pair_chunk_size):
+                    needed = {index for pair in pair_chunk for index in pair}
+                    jobs.append((pair_chunk, {index: token_lists[index] for index in needed}, threshold))
+                matches = [match for chunk in executor.map(_verify_chunk, jobs) for match in chunk]
+
+    groups = _cluster(len(scenarios), matches)
+    group_of = {index: number for number, members in enumerate(groups) for index in members}
+    min_link_similarity = [1.0] * len(groups)
+    for first, _, value in matches:
+        min_link_similarity[group_of[first]] = min(min_link_similarity[group_of[first]], value)
+    clusters = []
+    for number, members in enumerate(groups):
+        clusters.append({
+            'scenarios': [scenario_label(scenarios[index]) for index in members],
+            'exact': all(token_lists[index] == token_lists[members[0]] for index in members),
+            'min_link_similarity': min_link_similarity[number],
+        })
+    clusters.sort(key=lambda cluster: (-len(cluster['scenarios']), -cluster['min_link_similarity']))
+
+    keyword_reuse, repeated_keywords, unknown_keywords = keyword_report(scenarios, library)
+    return {'clusters': clusters, 'keyword_reuse': keyword_reuse, 'repeated_keywords': repeated_keywords,
+            'unknown_keywords': unknown_keywords}
+
+
+# Function to collect scenarios from .feature and .txt files under the given paths
+def load_scenarios(paths):
+    scenarios = []
+    for path in paths:
+        files = [path]
+        if os.path.isdir(path):
+            files = sorted(
+                os.path.join(folder, name)
+                for folder, _, names in os.walk(path)
+                for name in names
+                if name.endswith(('.feature', '.txt'))
+            )
+        for file_path in files:
+            with open(file_path, encoding='utf-8', errors='replace') as feature_file:
+                scenarios.extend(parse_scenarios(feature_file.read(), file_path))
+    return scenarios
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find duplicate Gherkin scenarios and reused keyword combinations.")
+    parser.add_argument('paths', nargs='+', help=".feature/.txt files or folders holding them")
+    parser.add_argument('--threshold', type=float, default=0.8, help="minimum similarity of near-duplicates (0-1)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--library', default=None,
+                        help="keyword catalog to check steps against (default: Keyword_Identified.xlsx of the app)")
+    parser.add_argument('--no-library', action='store_true', help="skip the check against the keyword catalog")
+    args = parser.parse_args()
+
+    scenarios = load_scenarios(args.paths)
+    library = None if args.no_library else load_library(args.library)
+    report = find_duplicate_scenarios(scenarios, threshold=args.threshold, workers=args.workers, library=library)
+    print(f"{len(scenarios)} scenarios, {len(report['clusters'])} duplicate clusters")
+
+    for number, cluster in enumerate(report['clusters'], start=1):
+        kind = ("exact duplicates" if cluster['exact']
+                else f"near duplicates (weakest verified link {cluster['min_link_similarity']:.2f})")
+        print(f"\nCluster {number}: {kind}")
+        for label in cluster['scenarios']:
+            print(f"  {label}")
+
+    if report['keyword_reuse']:
+        print("\nScenarios reusing the same keyword combination:")
+        for combination, labels in report['keyword_reuse'].items():
+            print("  " + " / ".join(f"{kind} {keyword}" for kind, keyword in combination))
+            for label in labels:
+                print(f"    {label}")
+
+    if report['repeated_keywords']:
+        print("\nKeywords repeated inside a scenario:")
+        for label, keywords in report['repeated_keywords'].items():
+            print(f"  {label}")
+            for keyword in keywords:
+                print(f"    {keyword}")
+
+    if report['unknown_keywords']:
+        print("\nKeywords not found in the keyword library:")
+        for label, keywords in report['unknown_keywords'].items():
+            print(f"  {label}")
+            for keyword in keywords:
+                print(f"    {keyword}")
+    return 0
+
+
+if __name__ == '__main__':
+    freeze_support()
+    sys.exit(main())
@@ -0,0 +1,116 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+import startup_bundle
+
+# Modules GherkinEase imports at launch
+APP_IMPORTS = ['streamlit', 'pandas', 'autocorrect']
+
+# Snippet run in a fresh interpreter to time one import
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+__import__(sys.argv[1])
+print(json.dumps({'seconds': time.perf_counter() - start}))
+"""
+
+# Snippet run in a fresh interpreter to render the home page once and report peak RSS
+FIRST_PAGE_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file(sys.argv[1], default_timeout=120)
+app.run()
+seconds = time.perf_counter() - start
+try:
+    import resource
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        rss_kb //= 1024  # macOS reports bytes
+except ImportError:
+    rss_kb = None  # No resource module on Windows
+print(json.dumps({'seconds': seconds, 'rss_mb': None if rss_kb is None else rss_kb / 1024,
+                  'errors': [str(error.value) for error in app.exception]}))
+"""
+
+
+# Function to run a probe in a new interpreter, so nothing is already imported or cached
+def run_probe(code, argument, use_bundle):
+    env = dict(os.environ)
+    if use_bundle:
+        env.pop(startup_bundle.DISABLE_ENV, None)
+    else:
+        env[startup_bundle.DISABLE_ENV] = '1'
+    result = subprocess.run(
+        [sys.executable, '-c', code, argument],
+        cwd=startup_bundle.app_dir(), env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Probe failed with exit code {result.returncode}:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def benchmark_imports(repeat):
+    """Returns the median cold import time of each module the app loads at launch."""
+    return {
+        module: statistics.median(run_probe(IMPORT_PROBE, module, True)['seconds'] for _ in range(repeat))
+        for module in APP_IMPORTS
+    }
+
+
+def benchmark_first_page(repeat, use_bundle):
+    """Returns the median time to first page and the peak RSS for one startup mode."""
+    app_path = os.path.join(startup_bundle.app_dir(), 'GherkinEase.py')
+    pages = [run_probe(FIRST_PAGE_PROBE, app_path, use_bundle) for _ in range(repeat)]
+    return {
+        'first_page_seconds': statistics.median(page['seconds'] for page in pages),
+        'rss_mb': max((page['rss_mb'] for page in pages if page['rss_mb'] is not None), default=None),
+        'errors': sorted({error for page in pages for error in page['errors']}),
+    }
+
+
+def print_report(label, report):
+    print(f"{label}:")
+    print(f"  time to first page  {report['first_page_seconds']:7.3f} s")
+    if report['rss_mb'] is not None:
+        print(f"  peak RSS            {report['rss_mb']:7.1f} MB")
+    for error in report['errors']:
+        print(f"  error: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure GherkinEase cold start with and without the startup bundle.")
+    parser.add_argument('--repeat', type=int, default=3, help="fresh interpreter runs per measurement")
+    parser.add_argument('--build', action='store_true', help="rebuild the startup bundle before measuring")
+    parser.add_argument('--json', action='store_true', help="print the raw results as JSON")
+    args = parser.parse_args()
+
+    if args.build:
+        startup_bundle.build_bundle()
+
+    results = {
+        'imports': benchmark_imports(args.repeat),
+        'excel': benchmark_first_page(args.repeat, use_bundle=False),
+    }
+    if startup_bundle.load_manifest() is not None:
+        results['bundle'] = benchmark_first_page(args.repeat, use_bundle=True)
+    else:
+        print("No usable startup bundle; run `python startup_bundle.py` or pass --build.")
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print("Cold imports:")
+    for module, seconds in results['imports'].items():
+        print(f"  import {module:<12} {seconds:7.3f} s")
+    print_report("Parsing the Excel workbooks", results['excel'])
+    if 'bundle' in results:
+        print_report("Startup bundle", results['bundle'])
+
+
+if __name__ == '__main__':
+    main()
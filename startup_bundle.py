@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import pickle
+import sys
+
+# Workbooks that GherkinEase parses at launch
+KEYWORDS_WORKBOOK = 'Keyword_Identified.xlsx'
+SIGNALS_WORKBOOK = 'CORE_CIL_v27.1_09Feb2024 1.xlsx'
+
+BUNDLE_DIR = 'startup_bundle'
+MANIFEST_FILE = 'manifest.json'
+KEYWORDS_FILE = 'keywords.pickle'
+SIGNALS_FILE = 'signals.pickle'
+SPELL_FILE = 'spell_en.pickle'
+BUNDLE_VERSION = 2
+# Set this environment variable to ignore the bundle and parse the workbooks (used by startup_benchmark.py)
+DISABLE_ENV = 'GHERKINEASE_NO_BUNDLE'
+# Libraries whose version must match the one the bundle was built with
+BUNDLED_LIBRARIES = ('pandas', 'numpy', 'autocorrect')
+
+# Manifest validated by load_manifest, kept for the rest of the process
+_UNCHECKED = object()
+_manifest = _UNCHECKED
+
+
+# Function to find the folder holding the app files (next to the executable when frozen by cx_Freeze)
+def app_dir():
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def bundle_path(name=''):
+    return os.path.join(app_dir(), BUNDLE_DIR, name)
+
+
+def library_versions():
+    """Returns the installed version of each library the pickles depend on."""
+    import importlib
+    from importlib.metadata import PackageNotFoundError, version
+
+    versions = {}
+    for library in BUNDLED_LIBRARIES:
+        # __version__ survives freezing; autocorrect only has package metadata
+        versions[library] = getattr(importlib.import_module(library), '__version__', None)
+        if versions[library] is None:
+            try:
+                versions[library] = version(library)
+            except PackageNotFoundError:
+                pass
+    return versions
+
+
+def file_digest(path):
+    """Returns the sha256 of a file, used to detect a stale bundle."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for block in iter(lambda: source.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# Function to parse the keyword sheet into the DataFrame the app displays
+def read_keywords_workbook(path):
+    import pandas as pd
+    df = pd.read_excel(path, sheet_name='KEYWORDS', header=None)
+    column_names = df.iloc[6].tolist()  # Extract column names from the 7th row (index 6)
+    df = df.iloc[7:].reset_index(drop=True)  # Remove the first 7 rows
+    df.dropna(subset=[df.columns[1]], inplace=True)  # Drop rows where the keyword is NaN
+    df.columns = column_names  # Set column names from the 7th row
+    return df, column_names
+
+
+# Function to parse the Rx and Tx sheets of the corecil Excel
+def read_signals_workbook(path):
+    import pandas as pd
+    rx_df = pd.read_excel(path, sheet_name='Rx')
+    tx_df = pd.read_excel(path, sheet_name='Tx')
+    return rx_df, tx_df
+
+
+def keywords_to_dict(df):
+    return df.set_index(df.columns[1]).T.to_dict('list')  # Map keywords to their details
+
+
+def _write_file(name, data):
+    """Writes one bundle file and returns its sha256, checked again when the file is read."""
+    with open(bundle_path(name), 'wb') as bundle_file:
+        bundle_file.write(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+def _read_file(name, digest):
+    """Returns the unpickled contents of a bundle file, or None if it is missing, changed or unreadable."""
+    try:
+        with open(bundle_path(name), 'rb') as bundle_file:
+            data = bundle_file.read()
+    except OSError:
+        return None
+    if hashlib.sha256(data).hexdigest() != digest:
+        return None
+    try:
+        return pickle.loads(data)
+    except Exception:
+        # e.g. pickled by a pandas or numpy this interpreter cannot import from
+        return None
+
+
+def build_bundle():
+    """Preprocesses the keyword catalog, signal sheets and spell dictionary into the bundle folder.
+
+    The DataFrames are pickled as read from Excel: their object columns mix
+    numbers, dates, text and NaN, which only a pickle keeps exactly.
+    """
+    from autocorrect import Speller
+
+    os.makedirs(bundle_path(), exist_ok=True)
+    base = app_dir()
+
+    df, _ = read_keywords_workbook(os.path.join(base, KEYWORDS_WORKBOOK))
+    rx_df, tx_df = read_signals_workbook(os.path.join(base, SIGNALS_WORKBOOK))
+
+    def dump(value):
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    manifest = {
+        'version': BUNDLE_VERSION,
+        'libraries': library_versions(),
+        'sources': {
+            KEYWORDS_WORKBOOK: file_digest(os.path.join(base, KEYWORDS_WORKBOOK)),
+            SIGNALS_WORKBOOK: file_digest(os.path.join(base, SIGNALS_WORKBOOK)),
+        },
+        'files': {
+            KEYWORDS_FILE: _write_file(KEYWORDS_FILE, dump(df)),
+            SIGNALS_FILE: _write_file(SIGNALS_FILE, dump((rx_df, tx_df))),
+            # The spell dictionary ships as a gzipped json inside autocorrect; a pickle loads much faster
+            SPELL_FILE: _write_file(SPELL_FILE, dump(Speller(lang='en').nlp_data)),
+        },
+    }
+    with open(bundle_path(MANIFEST_FILE), 'w', encoding='utf-8') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    reset_manifest_cache()
+    return manifest
+
+
+def reset_manifest_cache():
+    """Forgets the validated manifest, so the next load_manifest checks the bundle again."""
+    global _manifest
+    _manifest = _UNCHECKED
+
+
+def load_manifest():
+    """Returns the bundle manifest, or None when there is no usable bundle.
+
+    A bundle is rejected when it was built by another bundle version or with
+    other pandas, numpy or autocorrect versions, or when a source workbook
+    next to it no longer matches the digest recorded at build time. The
+    result is computed once per process; see reset_manifest_cache.
+    """
+    global _manifest
+    if os.environ.get(DISABLE_ENV):
+        return None
+    if _manifest is _UNCHECKED:
+        _manifest = _validate_manifest()
+    return _manifest
+
+
+def _validate_manifest():
+    try:
+        with open(bundle_path(MANIFEST_FILE), encoding='utf-8') as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != BUNDLE_VERSION or manifest.get('libraries') != library_versions():
+        return None
+    for source, digest in manifest.get('sources', {}).items():
+        source_path = os.path.join(app_dir(), source)
+        if os.path.exists(source_path) and file_digest(source_path) != digest:
+            return None
+    return manifest
+
+
+def _load(name):
+    manifest = load_manifest()
+    if manifest is None or name not in manifest.get('files', {}):
+        return None
+    return _read_file(name, manifest['files'][name])
+
+
+def load_keywords():
+    """Returns (df, keywords_dict, column_names) from the bundle, or None if it is unavailable."""
+    df = _load(KEYWORDS_FILE)
+    if df is None:
+        return None
+    return df, keywords_to_dict(df), df.columns.tolist()
+
+
+def load_signals():
+    """Returns (rx_df, tx_df) from the bundle, or None if it is unavailable."""
+    return _load(SIGNALS_FILE)
+
+
+def load_spell_data():
+    """Returns the precomputed autocorrect word counts, or None if they are unavailable."""
+    return _load(SPELL_FILE)
+
+
+if __name__ == '__main__':
+    manifest = build_bundle()
+    print(f"Startup bundle written to {bundle_path()}")
+    for source, digest in manifest['sources'].items():
+        print(f"  {source}: {digest[:12]}")
@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+pytest.importorskip('numpy')
+pytest.importorskip('textdistance')
+
+import duplicate_scenarios
+
+
+FEATURE = """Feature: Power mode
+  Background:
+    Given the ignition is "off"
+
+  Scenario: A
+    Given the vehicle is in power mode "6"
+    And the brake pedal is "pressed"
+    When the start stop switch is "pushed"
+    Then the power mode transits to "7"
+    But the horn is "off"
+
+  Example: B
+    Given the vehicle speed is "0" kph
+    Then the vehicle is in "P" gear
+
+  Scenario Outline: C
+    Given the vehicle speed is "<speed>" kph
+    Examples:
+      | speed |
+      | 10    |
+    And this line belongs to the table section
+"""
+
+
+def _scenario(name, steps):
+    return {'source': 'test.feature', 'line': 1, 'name': name, 'steps': steps}
+
+
+def _scenario_repository():
+    """Returns unrelated scenarios plus an exact copy and a near copy of the first one."""
+    generator = random.Random(3)
+    words = [f'word{i}' for i in range(300)]
+    scenarios = []
+    for number in range(60):
+        steps = [(kind, ' '.join(generator.choices(words, k=8)))
+                 for kind in ('Given', 'Given', 'When', 'Then', 'Then')]
+        scenarios.append(_scenario(f's{number}', steps))
+    scenarios.append(_scenario('exact', list(scenarios[0]['steps'])))
+    near_steps = list(scenarios[5]['steps'])
+    near_steps[-1] = ('Then', near_steps[-1][1] + ' again')
+    scenarios.append(_scenario('near', near_steps))
+    return scenarios
+
+
+def test_and_but_take_the_previous_kind():
+    scenario = duplicate_scenarios.parse_scenarios(FEATURE)[0]
+    assert [kind for kind, _ in scenario['steps']] == ['Given', 'Given', 'When', 'Then', 'Then']
+
+
+def test_scenario_boundaries():
+    scenarios = duplicate_scenarios.parse_scenarios(FEATURE)
+    assert [scenario['name'] for scenario in scenarios] == ['A', 'B', 'C']
+    # Example: starts a new scenario; Background steps belong to none
+    assert len(scenarios[0]['steps']) == 5
+    assert scenarios[1]['steps'] == [('Given', 'the vehicle speed is "0" kph'), ('Then', 'the vehicle is in "P" gear')]
+    # Examples: ends the scenario, so nothing after the table header is a step of C
+    assert scenarios[2]['steps'] == [('Given', 'the vehicle speed is "<speed>" kph')]
+
+
+def test_exact_and_near_duplicates_cluster_separately():
+    report = duplicate_scenarios.find_duplicate_scenarios(_scenario_repository(), workers=1)
+    clusters = {tuple(sorted(name.split()[-1] for name in cluster['scenarios'])): cluster
+                for cluster in report['clusters']}
+    assert set(clusters) == {('exact', 's0'), ('near', 's5')}
+    assert clusters[('exact', 's0')]['exact']
+    assert not clusters[('near', 's5')]['exact']
+    assert 0.8 <= clusters[('near', 's5')]['min_link_similarity'] < 1
+
+
+def test_process_pool_matches_single_process():
+    scenarios = _scenario_repository()
+    assert (duplicate_scenarios.find_duplicate_scenarios(scenarios, workers=1)
+            == duplicate_scenarios.find_duplicate_scenarios(scenarios, workers=2))
+
+
+def test_keyword_report():
+    first = _scenario('first', [('Given', 'the speed is "10" kph'), ('Then', 'the lamp is "on"')])
+    second = _scenario('second', [('Given', 'the speed is "90" kph'), ('Then', 'the lamp is "off"')])
+    repeated = _scenario('repeated', [('Given', 'the lamp is "on"'), ('Then', 'the lamp is "off"')])
+    library = duplicate_scenarios.library_keywords(['speed is "<speed>" kph\n ---> the lamp is "<state>"'])
+    reused, repeats, unknown = duplicate_scenarios.keyword_report([first, second, repeated], library)
+    assert list(reused.values()) == [['test.feature:1 first', 'test.feature:1 second']]
+    assert repeats == {'test.feature:1 repeated': ['the lamp is ""']}
+    assert unknown == {}
+    _, _, unknown = duplicate_scenarios.keyword_report([first], {'lamp is ""'})
+    assert unknown == {'test.feature:1 first': ['the speed is "" kph']}
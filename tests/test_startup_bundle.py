@@ -0,0 +1,118 @@
+import hashlib
+import os
+import shutil
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('openpyxl')
+pytest.importorskip('autocorrect')
+
+import startup_bundle
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='module')
+def bundle_dir(tmp_path_factory):
+    folder = tmp_path_factory.mktemp('app')
+    for workbook in (startup_bundle.KEYWORDS_WORKBOOK, startup_bundle.SIGNALS_WORKBOOK):
+        shutil.copy(os.path.join(ROOT, workbook), folder / workbook)
+    patch = pytest.MonkeyPatch()
+    patch.setattr(startup_bundle, 'app_dir', lambda: str(folder))
+    patch.delenv(startup_bundle.DISABLE_ENV, raising=False)
+    startup_bundle.build_bundle()
+    yield folder
+    patch.undo()
+    startup_bundle.reset_manifest_cache()
+
+
+@pytest.fixture(autouse=True)
+def fresh_manifest():
+    # load_manifest caches per process; each test validates the bundle again
+    startup_bundle.reset_manifest_cache()
+    yield
+    startup_bundle.reset_manifest_cache()
+
+
+def _read_bytes(path):
+    with open(path, 'rb') as source:
+        return source.read()
+
+
+def _write_bytes(path, data):
+    with open(path, 'wb') as target:
+        target.write(data)
+
+
+def test_keywords_round_trip(bundle_dir):
+    df, column_names = startup_bundle.read_keywords_workbook(bundle_dir / startup_bundle.KEYWORDS_WORKBOOK)
+    bundled_df, keywords_dict, bundled_names = startup_bundle.load_keywords()
+    pd.testing.assert_frame_equal(bundled_df, df)
+    # Compared as frames because the detail lists hold NaN, which never equals itself
+    expected_dict = startup_bundle.keywords_to_dict(df)
+    assert list(keywords_dict) == list(expected_dict)
+    pd.testing.assert_frame_equal(pd.DataFrame(keywords_dict), pd.DataFrame(expected_dict))
+    assert bundled_names == column_names
+
+
+def test_signals_round_trip(bundle_dir):
+    rx_df, tx_df = startup_bundle.read_signals_workbook(bundle_dir / startup_bundle.SIGNALS_WORKBOOK)
+    bundled_rx, bundled_tx = startup_bundle.load_signals()
+    pd.testing.assert_frame_equal(bundled_rx, rx_df)
+    pd.testing.assert_frame_equal(bundled_tx, tx_df)
+
+
+def test_damaged_bundle_falls_back(bundle_dir):
+    keywords_path = startup_bundle.bundle_path(startup_bundle.KEYWORDS_FILE)
+    signals_path = startup_bundle.bundle_path(startup_bundle.SIGNALS_FILE)
+    keywords_data = _read_bytes(keywords_path)
+    signals_data = _read_bytes(signals_path)
+    try:
+        _write_bytes(keywords_path, keywords_data[:len(keywords_data) // 2])
+        os.remove(signals_path)
+        assert startup_bundle.load_keywords() is None
+        assert startup_bundle.load_signals() is None
+        assert startup_bundle.load_spell_data() is not None
+    finally:
+        _write_bytes(keywords_path, keywords_data)
+        _write_bytes(signals_path, signals_data)
+
+
+def test_unpicklable_bundle_falls_back(bundle_dir, monkeypatch):
+    # Digest matches, but the pickle refers to a module this interpreter lacks,
+    # as a bundle built under numpy 2 (numpy._core) does under numpy 1.26
+    keywords_path = startup_bundle.bundle_path(startup_bundle.KEYWORDS_FILE)
+    keywords_data = _read_bytes(keywords_path)
+    unpicklable = b'cnumpy._not_a_module\nthing\n.'
+    manifest = startup_bundle.load_manifest()
+    monkeypatch.setitem(manifest['files'], startup_bundle.KEYWORDS_FILE, hashlib.sha256(unpicklable).hexdigest())
+    try:
+        _write_bytes(keywords_path, unpicklable)
+        assert startup_bundle.load_keywords() is None
+        assert startup_bundle.load_signals() is not None
+    finally:
+        _write_bytes(keywords_path, keywords_data)
+
+
+def test_other_library_versions_invalidate_bundle(bundle_dir, monkeypatch):
+    versions = dict(startup_bundle.library_versions(), numpy='2.0.0')
+    monkeypatch.setattr(startup_bundle, 'library_versions', lambda: versions)
+    assert startup_bundle.load_manifest() is None
+    assert startup_bundle.load_spell_data() is None
+
+
+def test_manifest_is_validated_once(bundle_dir, monkeypatch):
+    digests = []
+    real_digest = startup_bundle.file_digest
+    monkeypatch.setattr(startup_bundle, 'file_digest', lambda path: digests.append(path) or real_digest(path))
+    startup_bundle.load_keywords()
+    startup_bundle.load_signals()
+    startup_bundle.load_spell_data()
+    assert len(digests) == 2
+
+
+def test_changed_workbook_invalidates_bundle(bundle_dir, monkeypatch):
+    monkeypatch.setattr(startup_bundle, 'file_digest', lambda path: 'changed')
+    assert startup_bundle.load_manifest() is None
+    assert startup_bundle.load_keywords() is None